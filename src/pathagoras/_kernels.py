@@ -0,0 +1,77 @@
+"""
+_kernels.py — Scalar numeric kernels used by core.TriangleData.
+
+The kernels are plain functions on floats, so they are compiled with Numba
+when it is installed (`pip install -e ".[fast]"`). Without Numba they run as
+ordinary Python functions and behave identically.
+
+fastmath is intentionally not enabled: it allows the compiler to reassociate
+(c - a) * (c + a) back into c*c - a*a, which would undo the numerically
+stable forms used below.
+"""
+
+import math
+import sys
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(**_options):
+        """Stand-in for numba.njit(...) that returns the function unchanged."""
+        return lambda func: func
+else:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = True
+
+# Bound once at import: a global name lookup instead of math + attribute per
+# call on the pure-Python path (Numba resolves both forms at compile time).
+_hypot = math.hypot
+_sqrt = math.sqrt
+
+# Range of normal floats: a product outside it has overflowed or lost precision.
+FLOAT_MIN = sys.float_info.min
+FLOAT_MAX = sys.float_info.max
+
+# Right-angle tolerance, shared with batch.py: |c^2 - a^2 - b^2| may be up to
+# RIGHT_REL_TOL * c^2, but never less than the absolute floor RIGHT_ABS_TOL.
+RIGHT_REL_TOL = 1e-9
+RIGHT_ABS_TOL = 1e-12
+# sqrt(RIGHT_ABS_TOL): (RIGHT_ABS_TOL_ROOT / c)^2 is the floor in units of c^2.
+RIGHT_ABS_TOL_ROOT = math.sqrt(RIGHT_ABS_TOL)
+
+
+@njit(cache=True)
+def hypotenuse(a, b):
+    """Return sqrt(a^2 + b^2) without intermediate overflow/underflow."""
+    return _hypot(a, b)
+
+
+@njit(cache=True)
+def leg(c, known):
+    """Return the missing leg sqrt(c^2 - known^2) in factored form."""
+    prod = (c - known) * (c + known)
+    if FLOAT_MIN <= prod <= FLOAT_MAX:
+        # One rounding before the square root: exact for integer triples.
+        return _sqrt(prod)
+    # The product overflowed or underflowed: take the square root per factor.
+    return _sqrt(c - known) * _sqrt(c + known)
+
+
+@njit(cache=True)
+def is_right(a, b, c):
+    """Return True if a^2 + b^2 == c^2 within a tolerance relative to c^2."""
+    if c == 0.0:
+        # Degenerate triangle: only the absolute floor applies (no division).
+        return a * a + b * b <= RIGHT_ABS_TOL
+    # (c^2 - a^2 - b^2) / c^2 on the sides divided by c, so no square can
+    # overflow/underflow; 1 - (a/c)^2 is factored so that large and small
+    # squares are not subtracted directly (Kahan).
+    ra = a / c
+    rb = b / c
+    diff = (1.0 - ra) * (1.0 + ra) - rb * rb
+    floor = RIGHT_ABS_TOL_ROOT / c
+    tol = floor * floor
+    if tol < RIGHT_REL_TOL:
+        tol = RIGHT_REL_TOL
+    return -tol <= diff <= tol
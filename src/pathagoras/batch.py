@@ -0,0 +1,144 @@
+"""
+batch.py — Vectorised solve/verify for many triangles at once (NumPy).
+
+Inputs are three float arrays (one per side, structure-of-arrays layout) plus
+an array telling which side is missing in each row:
+
+- MISSING_A / MISSING_B / MISSING_C -> solve mode, that side is computed
+- MISSING_NONE                      -> verify mode, all three sides are given
+
+The rules are the same as in `core.proceed_data`; only the UI messages are
+left out. `core.proceed_data` stays the entry point for single triangles
+(the UI path), this module is meant for scripted or bulk use.
+
+Requires NumPy (`pip install -e ".[batch]"`).
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from pathagoras import _kernels
+
+MISSING_A = 0
+MISSING_B = 1
+MISSING_C = 2
+MISSING_NONE = 3
+
+
+@dataclass
+class TriangleBatch:
+    """
+    Structure-of-arrays result of proceed_data_batch().
+
+    Arrays
+    ------
+    a, b, c:
+        float64 sides. Solved rows contain the computed side; verified rows
+        are sorted ascending (same as TriangleData.normalise()). Invalid rows
+        keep their input values.
+    is_valid:
+        True where the input was valid and the triangle is possible.
+    is_right:
+        True where the triangle is valid and right-angled within tolerance.
+    """
+    a: np.ndarray
+    b: np.ndarray
+    c: np.ndarray
+    is_valid: np.ndarray
+    is_right: np.ndarray
+
+
+def _given_ok(values: np.ndarray, absent: np.ndarray) -> np.ndarray:
+    """Row mask: the side is either absent or a positive finite number."""
+    return absent | (np.isfinite(values) & (values > 0))
+
+
+def _leg(c: np.ndarray, known: np.ndarray) -> np.ndarray:
+    """Missing legs, same as _kernels.leg() row by row."""
+    with np.errstate(over="ignore"):
+        prod = (c - known) * (c + known)
+    out = np.sqrt(prod)
+    split = ~((prod >= _kernels.FLOAT_MIN) & (prod <= _kernels.FLOAT_MAX))
+    out[split] = np.sqrt(c[split] - known[split]) * np.sqrt(c[split] + known[split])
+    return out
+
+
+def proceed_data_batch(a, b, c, missing) -> TriangleBatch:
+    """
+    Solve or verify N triangles with vectorised NumPy operations.
+
+    Parameters
+    ----------
+    a, b, c:
+        1-D array-likes of length N with the side values. The value of the
+        missing side in a row is ignored (NaN is a convenient filler).
+    missing:
+        1-D integer array-like of length N with one of MISSING_A, MISSING_B,
+        MISSING_C or MISSING_NONE per row. Any other code marks the row invalid.
+
+    Returns
+    -------
+    TriangleBatch
+        New arrays; the inputs are not modified.
+
+    Raises
+    ------
+    ValueError
+        If the inputs are not 1-D arrays of the same length.
+    """
+    a = np.array(a, dtype=np.float64)
+    b = np.array(b, dtype=np.float64)
+    c = np.array(c, dtype=np.float64)
+    missing = np.asarray(missing)
+
+    if a.ndim != 1 or not (a.shape == b.shape == c.shape == missing.shape):
+        raise ValueError("a, b, c and missing must be 1-D arrays of the same length.")
+
+    solve_a = missing == MISSING_A
+    solve_b = missing == MISSING_B
+    solve_c = missing == MISSING_C
+    verify = missing == MISSING_NONE
+
+    is_valid = (
+        (solve_a | solve_b | solve_c | verify)
+        & _given_ok(a, solve_a)
+        & _given_ok(b, solve_b)
+        & _given_ok(c, solve_c)
+    )
+
+    # Solve mode: missing hypotenuse
+    rows = is_valid & solve_c
+    c[rows] = np.hypot(a[rows], b[rows])
+
+    # Solve mode: missing leg, the known leg must not exceed the hypotenuse
+    is_valid &= ~(solve_b & (a > c)) & ~(solve_a & (b > c))
+
+    rows = is_valid & solve_b
+    b[rows] = _leg(c[rows], a[rows])
+
+    rows = is_valid & solve_a
+    a[rows] = _leg(c[rows], b[rows])
+
+    # Verify mode: sort sides, then triangle inequality and Pythagorean check
+    rows = is_valid & verify
+    sides = np.sort(np.stack([a[rows], b[rows], c[rows]], axis=1), axis=1)
+    s0, s1, s2 = sides[:, 0], sides[:, 1], sides[:, 2]
+    a[rows], b[rows], c[rows] = s0, s1, s2
+
+    possible = s0 + s1 > s2
+    # Vectorised _kernels.is_right() with its tolerance constants
+    # (s2 > 0 here, so the c == 0 branch is not needed)
+    r0 = s0 / s2
+    r1 = s1 / s2
+    diff = (1.0 - r0) * (1.0 + r0) - r1 * r1
+    with np.errstate(over="ignore"):  # the floor term is inf for tiny sides
+        floor = _kernels.RIGHT_ABS_TOL_ROOT / s2
+        tol = np.maximum(_kernels.RIGHT_REL_TOL, floor * floor)
+    right = possible & (np.abs(diff) <= tol)
+
+    is_valid[rows] = possible
+    is_right = is_valid & ~verify
+    is_right[rows] = right
+
+    return TriangleBatch(a=a, b=b, c=c, is_valid=is_valid, is_right=is_right)
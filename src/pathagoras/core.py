@@ -1,9 +1,48 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 import math
+import re
 from typing import Optional
 
+from pathagoras import _kernels
 
-@dataclass
+# Used per field in _parse_value()
+_isfinite = math.isfinite
+
+_REQUIRED_KEYS = frozenset(("a", "b", "c"))
+
+# User-facing error messages shared by the raising methods/validators and the
+# non-raising proceed_data path.
+_MSG_KEYS = "Data must contain exactly keys: a, b, c"
+_MSG_LEG_TOO_LONG = "Hypotenuse c must be greater than the known leg."
+_MSG_IMPOSSIBLE = "Input sorted: largest treated as hypotenuse. Triangle is impossible: a + b <= c ."
+_MSG_MISSING = "Enter exactly two values to compute the missing one, or all three values to verify."
+
+# Decimal/scientific notation as accepted by float(), including PEP 515
+# underscores between digits, plus inf/nan spellings so that those still reach
+# the dedicated "must be finite" check.
+_DIGITS = r"\d(?:_?\d)*"
+_NUMBER_RE = re.compile(
+    rf"\s*[-+]?(?:(?:{_DIGITS}\.?(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][-+]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE,
+)
+
+
+# Input rules as non-raising predicates: each returns an error message or None.
+# Used by the raising TriangleData methods and by the proceed_data mode handlers.
+def _leg_error(known: float, c: float) -> str | None:
+    """The known leg must not exceed the hypotenuse."""
+    return _MSG_LEG_TOO_LONG if known > c else None
+
+
+def _triangle_error(a: float, b: float, c: float) -> str | None:
+    """Triangle inequality for sides sorted ascending (c is the largest)."""
+    return _MSG_IMPOSSIBLE if a + b <= c else None
+
+
+@dataclass(slots=True)
 class TriangleData:
     """
     Container for triangle inputs and computed/verified results.
@@ -41,7 +80,8 @@ class TriangleData:
 
         Effects
         -------
-        - Sets c to sqrt(a^2 + b^2).
+        - Sets c to hypot(a, b), i.e. sqrt(a^2 + b^2) without intermediate
+          overflow/underflow for extreme magnitudes.
         - Sets is_valid = True and is_right = True (right-angled by definition).
 
         Raises
@@ -52,7 +92,7 @@ class TriangleData:
         if self.a is None or self.b is None:
             raise ValueError("Both legs a and b are required to compute hypotenuse c.")
 
-        self.c = math.sqrt(self.a * self.a + self.b * self.b)
+        self.c = _kernels.hypotenuse(self.a, self.b)
 
         self.is_valid = True
         self.is_right = True
@@ -71,7 +111,10 @@ class TriangleData:
 
         Effects
         -------
-        - Sets the missing leg (a or b).
+        - Sets the missing leg (a or b) to sqrt((c - known) * (c + known)).
+          The factored form avoids the cancellation of c^2 - known^2 when the
+          known leg is close to the hypotenuse. If the product overflows or
+          underflows, the square root is taken per factor instead.
         - Sets is_valid = True and is_right = True (right-angled by definition).
 
         Raises
@@ -86,13 +129,14 @@ class TriangleData:
         if (self.a is None) == (self.b is None):  # both None or both provided
             raise ValueError("Exactly one leg (a or b) must be provided to compute the other.")
         known = self.a if self.a is not None else self.b
-        if known > self.c:
-            raise ValueError("Hypotenuse c must be greater than the known leg.")
+        error = _leg_error(known, self.c)
+        if error is not None:
+            raise ValueError(error)
 
         if self.a is not None:
-            self.b = math.sqrt(self.c * self.c - self.a * self.a)
+            self.b = _kernels.leg(self.c, self.a)
         else:
-            self.a = math.sqrt(self.c * self.c - self.b * self.b)
+            self.a = _kernels.leg(self.c, self.b)
 
         self.is_valid = True
         self.is_right = True
@@ -105,7 +149,7 @@ class TriangleData:
         -----
         Expects current semantics: a and b are legs, c is hypotenuse.
         In verification mode, call normalise() first so that the largest side
-        is treated as hypotenuse candidate.
+        is treated as hypotenuse candidate. The tolerance is relative to c^2.
 
         Effects
         -------
@@ -119,15 +163,7 @@ class TriangleData:
         if self.a is None or self.b is None or self.c is None:
             raise ValueError("All three sides are required to verify a triangle.")
 
-        a, b, c = self.a, self.b, self.c
-
-        lhs = a * a + b * b
-        rhs = c * c
-
-        self.is_right = abs(lhs - rhs) <= max(
-            1e-12,
-            1e-9 * max(lhs, rhs)
-        )
+        self.is_right = _kernels.is_right(self.a, self.b, self.c)
 
     def is_triangle_possible(self):
         """
@@ -146,10 +182,10 @@ class TriangleData:
         ValueError
             If a + b <= c (triangle inequality violated).
         """
-        if self.a + self.b <= self.c:
-            raise ValueError("Input sorted: largest treated as hypotenuse. Triangle is impossible: a + b <= c .")
-        else:
-            self.is_valid = True
+        error = _triangle_error(self.a, self.b, self.c)
+        if error is not None:
+            raise ValueError(error)
+        self.is_valid = True
 
     def normalise(self):
         """
@@ -179,10 +215,30 @@ class TriangleData:
         if self.a is None or self.b is None or self.c is None:
             raise ValueError("All three sides are required to validate a triangle.")
 
-        self.a, self.b, self.c = sorted([self.a, self.b, self.c])
+        a, b, c = self.a, self.b, self.c
+        if a <= b <= c:  # already ordered (e.g. 3, 4, 5): nothing to do
+            return
+
+        # 3-element sorting network: three compare-and-swap steps, no list.
+        if a > b:
+            a, b = b, a
+        if b > c:
+            b, c = c, b
+        if a > b:
+            a, b = b, a
+        self.a, self.b, self.c = a, b, c
 
 
-def validate_required_keys(data: dict[str, str | None]):
+def _check_required_keys(data: Mapping[str, str | None]) -> str | None:
+    """Return an error message if data does not have exactly the keys a, b, c."""
+    # dict_keys compares against a set directly: a length check plus membership
+    # tests, without building a temporary set from data.
+    if data.keys() != _REQUIRED_KEYS:
+        return _MSG_KEYS
+    return None
+
+
+def validate_required_keys(data: Mapping[str, str | None]):
     """
     Validate that the input dictionary contains exactly the required keys.
 
@@ -196,9 +252,56 @@ def validate_required_keys(data: dict[str, str | None]):
     ValueError
         If keys are missing or extra keys are present.
     """
-    required_keys = {"a", "b", "c"}
-    if set(data.keys()) != required_keys:
-        raise ValueError("Data must contain exactly keys: a, b, c")
+    error = _check_required_keys(data)
+    if error is not None:
+        raise ValueError(error)
+
+
+def _parse_value(key: str, value: str | None) -> tuple[float | None, str | None]:
+    """
+    Parse a single field value without raising.
+
+    Implements the rules documented in validate_value().
+
+    Returns
+    -------
+    tuple[float | None, str | None]
+        (number, None) on success, where number is None for a missing value,
+        or (None, error_message) if the value is present but invalid.
+    """
+    if value is None or isinstance(value, str) and value.strip() == "":
+        return None, None
+
+    # Strings are pre-screened so that typical invalid input ("abc", "3,5", "1e")
+    # is rejected without float() raising and unwinding an exception.
+    number = None
+    if not isinstance(value, str) or _NUMBER_RE.fullmatch(value):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            pass
+    if number is None:
+        return None, f"Field {key}: value must be a number."
+
+    if not _isfinite(number):
+        return None, f"Field {key}: value must be finite (not NaN or infinity)."
+
+    if number <= 0:
+        return None, f"Field {key}: value must be greater than zero."
+
+    return number, None
+
+
+# UI text is parsed over and over with the same few strings; results (including
+# error messages) are cached per (key, text). Non-string values bypass the cache.
+_parse_text = lru_cache(maxsize=256)(_parse_value)
+
+
+def _parse_field(key: str, value: str | None) -> tuple[float | None, str | None]:
+    """_parse_value() with caching for UI text (None/str values)."""
+    if value is None or isinstance(value, str):
+        return _parse_text(key, value)
+    return _parse_value(key, value)
 
 
 def validate_value(key: str, value: str | None) -> float | None:
@@ -230,24 +333,62 @@ def validate_value(key: str, value: str | None) -> float | None:
     ValueError
         If the value is present but invalid.
     """
-    if value is None or isinstance(value, str) and value.strip() == "":
-        return None
-
-    try:
-        number = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"Field {key}: value must be a number.")
-
-    if not math.isfinite(number):
-        raise ValueError(f"Field {key}: value must be finite (not NaN or infinity).")
-
-    if number <= 0:
-        raise ValueError(f"Field {key}: value must be greater than zero.")
-
+    number, error = _parse_field(key, value)
+    if error is not None:
+        raise ValueError(error)
     return number
 
 
-def proceed_data(data: dict[str, str | None]):
+def _solve_hypotenuse(triangle: TriangleData) -> str | None:
+    """Solve mode with c missing."""
+    triangle.compute_hypotenuse()
+    triangle.message = "Hypotenuse calculated"
+    return None
+
+
+def _solve_leg(triangle: TriangleData) -> str | None:
+    """Solve mode with a or b missing."""
+    known = triangle.a if triangle.a is not None else triangle.b
+    error = _leg_error(known, triangle.c)
+    if error is not None:
+        return error
+    triangle.compute_leg()
+    triangle.message = "Leg calculated"
+    return None
+
+
+def _verify(triangle: TriangleData) -> str | None:
+    """Verify mode: all three sides are present."""
+    triangle.normalise()
+    error = _triangle_error(triangle.a, triangle.b, triangle.c)
+    if error is not None:
+        return error
+    triangle.is_valid = True
+    triangle.is_right_triangle()
+    if not triangle.is_right:
+        triangle.message = "Input sorted: largest treated as hypotenuse. Triangle is NOT right"
+    else:
+        triangle.message = "Input sorted: largest treated as hypotenuse. Triangle is RIGHT"
+    return None
+
+
+def _reject_missing(_triangle: TriangleData) -> str | None:
+    """Any input shape other than the four legal ones: two or more values missing."""
+    return _MSG_MISSING
+
+
+# Mode handlers keyed by the presence mask of the sides:
+# bit 0 -> a present, bit 1 -> b present, bit 2 -> c present.
+# Each handler fills the triangle and returns None, or returns an error message.
+_MODES = {
+    0b011: _solve_hypotenuse,
+    0b101: _solve_leg,
+    0b110: _solve_leg,
+    0b111: _verify,
+}
+
+
+def proceed_data(data: Mapping[str, str | None]):
     """
     Main orchestration function for UI integration.
 
@@ -256,6 +397,7 @@ def proceed_data(data: dict[str, str | None]):
     data must contain keys {'a', 'b', 'c'} with values:
     - None or empty string -> treated as missing
     - otherwise -> parsed to positive finite float
+    data is only read, never modified (a read-only mapping is fine).
 
     Modes
     -----
@@ -272,7 +414,8 @@ def proceed_data(data: dict[str, str | None]):
     Error handling policy
     ---------------------
     This function never propagates ValueError to the UI.
-    All errors are captured and returned as TriangleData.message, with flags reset.
+    Invalid input is reported by the helpers as an error message (no exceptions
+    on this path); it is returned as TriangleData.message, with flags reset.
 
     Returns
     -------
@@ -281,35 +424,19 @@ def proceed_data(data: dict[str, str | None]):
     """
     triangle = TriangleData()
 
-    try:
-        validate_required_keys(data)
-        for key, value in data.items():
-            data[key] = validate_value(key, value)
-            setattr(triangle, key, data[key])
-
-        missing_keys = [k for k, v in data.items() if v is None]
-        if len(missing_keys) > 1:
-            raise ValueError("Enter exactly two values to compute the missing one, or all three values to verify.")
-        elif len(missing_keys) == 1:
-            if "c" in missing_keys:
-                triangle.compute_hypotenuse()
-                triangle.message = "Hypotenuse calculated"
-            else:
-                triangle.compute_leg()
-                triangle.message = "Leg calculated"
-        else:
-            triangle.normalise()
-            triangle.is_triangle_possible()
-            triangle.is_right_triangle()
-            if not triangle.is_right:
-                triangle.message = "Input sorted: largest treated as hypotenuse. Triangle is NOT right"
-            else:
-                triangle.message = "Input sorted: largest treated as hypotenuse. Triangle is RIGHT"
-
-        return triangle
-
-    except ValueError as e:
-        triangle.message = str(e)
+    error = _check_required_keys(data)
+    if error is None:
+        triangle.a, error = _parse_field("a", data["a"])
+    if error is None:
+        triangle.b, error = _parse_field("b", data["b"])
+    if error is None:
+        triangle.c, error = _parse_field("c", data["c"])
+    if error is None:
+        mask = (triangle.a is not None) | (triangle.b is not None) << 1 | (triangle.c is not None) << 2
+        error = _MODES.get(mask, _reject_missing)(triangle)
+
+    if error is not None:
+        triangle.message = error
         triangle.is_valid = False
         triangle.is_right = False
-        return triangle
+    return triangle
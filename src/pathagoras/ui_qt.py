@@ -8,7 +8,8 @@ and never propagates ValueError to the UI layer.
 
 Button behavior (critical requirement)
 --------------------------------------
-The action button behaves strictly as follows:
+The action button behaves strictly as follows (applied ~50 ms after the last edit;
+the first edit after a result is applied at once):
 - Exactly 2 non-empty fields (a/b/c)  -> button enabled, text = "Calculate"
 - Exactly 3 non-empty fields (a/b/c)  -> button enabled, text = "Verify"
 - Any other case (0, 1 fields)        -> button disabled, text = "—"
@@ -16,7 +17,9 @@ The action button behaves strictly as follows:
 On click:
 - reads texts from a/b/c fields,
 - normalizes decimal comma to dot for user convenience (e.g., "3,5" -> "3.5"),
-- calls `core.proceed_data({"a": a_txt, "b": b_txt, "c": c_txt})`,
+- calls `core.proceed_data({"a": a_txt, "b": b_txt, "c": c_txt})` on a
+  QThreadPool worker (the button stays disabled until the result arrives);
+  results are memoized per normalized input,
 - shows `result.message`,
 - if result is valid and all sides exist -> draws numeric values on the canvas,
   otherwise shows placeholder.
@@ -39,23 +42,89 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QFrame
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QFont
+from PySide6.QtCore import (
+    Qt, QEvent, QLineF, QPointF, QRunnable, QThreadPool, QTimer, Signal, Slot
+)
+from PySide6.QtGui import QPainter, QPen, QColor, QFont, QFontMetrics, QPixmap, QPolygonF
+from functools import lru_cache
 import sys
 import re
+import traceback
 
 from pathagoras import core
 
+# Styles for the computed output row (neutral, theme-independent). Scoped to
+# the container by object name and parsed once for the whole subtree.
+_OUTPUT_STYLE = """
+QWidget#outputContainer QLineEdit {
+    background-color: #3a3a3a;
+    color: #ffffff;
+    border: 1px solid #6a6a6a;
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-weight: 600;
+}
+QWidget#outputContainer QLineEdit:focus {
+    border: 1px solid #8fb2ff;
+}
+"""
+
+_LABEL_STYLE = """
+QWidget#outputContainer QLabel {
+    font-weight: 600;
+}
+"""
+
+# Decimal comma -> dot; no-break/thin spaces used as digit group separators
+# are dropped (see MainWindow._normalized_text)
+_NORMALIZE_TABLE = str.maketrans({
+    ",": ".",
+    "\u00A0": "",  # no-break space
+    "\u2009": "",  # thin space
+    "\u202F": "",  # narrow no-break space
+})
+
+# Sentence-ending punctuation followed by whitespace (see _wrap_sentences)
+_SENTENCE_RE = re.compile(r'([.!?])\s+')
+
+
+# Pure function of its argument; status texts come from a small fixed set
+# (guidance texts and core messages), so results are memoized.
+@lru_cache(maxsize=32)
+def _wrap_sentences(text: str) -> str:
+    """
+    Make the status output more readable by putting each sentence on a new line.
+
+    We split only when a sentence-ending punctuation is followed by whitespace:
+        '.', '!' or '?' + whitespace -> newline
+
+    This avoids breaking:
+    - decimal numbers: 3.14 (no whitespace after '.')
+    - scientific notation: 1e-3
+    - version-like tokens: v1.2.3 (no whitespace)
+    """
+    text = (text or "").strip()
+    if not text:
+        return ""
+    return _SENTENCE_RE.sub(r'\1\n', text)
+
 
 class TriangleCanvas(QFrame):
     """
     Drawing area that shows a placeholder right isosceles triangle
     with labels a, b, c. Later you can extend it to draw numeric values.
+
+    State changes only set plain attributes and then call `update()` once,
+    which Qt coalesces into a single paint. Do not use `repaint()` here: it
+    paints synchronously and would bypass that coalescing.
     """
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(260)
         self.setFrameShape(QFrame.StyledPanel)
+        # paintEvent fills every pixel itself; Qt does not need to clear first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
         self.has_result = False
         self.result_a = None
@@ -63,92 +132,168 @@ class TriangleCanvas(QFrame):
         self.result_c = None
         self.is_right = False
 
+        # Label texts like 'b = 12.34' (or just 'b' without a result); built by
+        # show_result()/show_placeholder(), not on every paint
+        self._label_a, self._label_b, self._label_c = "a", "b", "c"
+
         self.grid_enabled = True
         self.grid_step_px = 20  # distance between minor grid lines in pixels
         self.grid_major_every = 5  # every N minor lines draw a thicker major line
 
+        # Pre-rendered grid, rebuilt only when its key (size, origin, grid
+        # parameters, color, device pixel ratio) changes.
+        self._grid_cache: QPixmap | None = None
+        self._grid_cache_key = None
+
+        # Fully rendered content (grid + triangle + labels), keyed on everything
+        # that affects the drawing; see _frame_pixmap().
+        self._frame_cache: QPixmap | None = None
+        self._frame_cache_key = None
+
+        # Triangle points, outline, marker and label midpoints; see _geometry()
+        self._geom_cache = None
+        self._geom_cache_key = None
+
+        # Palette colors and pens, rebuilt only on palette/style changes
+        # (see changeEvent) instead of being looked up on every paint
+        self._fg = QColor()
+        self._bg = QColor()
+        self._pen_text = QPen()
+        self._pen_tri = QPen()
+        self._pen_ra = QPen()
+        self._pen_minor = QPen()
+        self._pen_major = QPen()
+        self._rebuild_pens()
+
+        # Label font and its metrics are created once, not on every paint
+        self._label_font = QFont("Arial", 12)
+        self._label_fm = QFontMetrics(self._label_font, self)
+
+    @Slot()
     def show_placeholder(self):
         """Switch to placeholder mode (no numeric values are displayed)."""
+        if not self.has_result:
+            return  # already showing the placeholder, nothing to repaint
+
         self.has_result = False
         self.is_right = False
+        self._label_a, self._label_b, self._label_c = "a", "b", "c"
         self.update()
 
+    @Slot(float, float, float, bool)
     def show_result(self, a: float, b: float, c: float, is_right: bool):
         """Switch to result mode and display numeric values for a, b, c."""
+        if self.has_result and (a, b, c, is_right) == (
+            self.result_a, self.result_b, self.result_c, self.is_right
+        ):
+            return  # same result already displayed, nothing to repaint
+
         self.has_result = True
         self.result_a, self.result_b, self.result_c = a, b, c
         self.is_right = is_right
+        self._label_a = f"a = {a:g}"
+        self._label_b = f"b = {b:g}"
+        self._label_c = f"c = {c:g}"
         self.update()
 
-    def _draw_grid(self, painter: QPainter, origin: tuple[int, int]):
-        """
-        Draw a background grid aligned to the triangle right angle.
-
-        The grid is not anchored to (0, 0). Instead, its major/minor lines
-        pass through `origin` (the right-angle point), so the grid axes are
-        visually co-linear with the legs (catheti).
-        """
-        if not self.grid_enabled:
-            return
+    def changeEvent(self, event):
+        """Refresh cached colors/pens and drop rendered caches when the palette or style changes."""
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange, QEvent.ApplicationPaletteChange):
+            self._rebuild_pens()
+            self._invalidate_caches()
+        super().changeEvent(event)
 
+    def _rebuild_pens(self):
+        """Read the foreground/background colors from the palette and rebuild the pens."""
         palette = self.palette()
-        fg = palette.color(self.foregroundRole())
+        self._fg = palette.color(self.foregroundRole())
+        self._bg = palette.color(self.backgroundRole())
+        self._pen_text = QPen(self._fg)    # labels
+        self._pen_tri = QPen(self._fg, 2)  # triangle edges
+        self._pen_ra = QPen(self._fg, 3)   # right-angle marker
 
         # Minor grid (more transparent)
-        minor = QPen(fg, 1)
-        minor_color = minor.color()
+        minor_color = QColor(self._fg)
         minor_color.setAlpha(35)
-        minor.setColor(minor_color)
+        self._pen_minor = QPen(minor_color, 1)
 
         # Major grid (less transparent)
-        major = QPen(fg, 1)
-        major_color = major.color()
+        major_color = QColor(self._fg)
         major_color.setAlpha(70)
-        major.setColor(major_color)
+        self._pen_major = QPen(major_color, 1)
+
+    def _invalidate_caches(self):
+        """Drop pre-rendered pixmaps so the next paint renders from scratch."""
+        self._grid_cache = None
+        self._frame_cache = None
+
+    def _elide(self, text: str, max_width: int) -> tuple[str, int]:
+        """
+        Return (elided text, its advance width) for the label font.
+
+        Not cached: labels are laid out only when the frame pixmap is rendered,
+        and its cache key already changes with the result, size and palette.
+        """
+        elided = self._label_fm.elidedText(text, Qt.ElideRight, max_width)
+        return elided, self._label_fm.horizontalAdvance(elided)
+
+    def _grid_pixmap(self, origin: tuple[int, int]) -> QPixmap:
+        """
+        Return the background grid as a cached pixmap covering the whole widget.
+
+        The grid lines are drawn only when the cache key changes (resize,
+        different origin, grid parameters or foreground color); every other
+        frame render just blits the pixmap.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), origin, self.grid_step_px, self.grid_major_every, self._fg.rgba(), dpr)
+
+        if self._grid_cache is None or key != self._grid_cache_key:
+            pixmap = self._new_pixmap()
+            grid_painter = QPainter(pixmap)
+            grid_painter.setRenderHint(QPainter.Antialiasing)
+            self._draw_grid(grid_painter, origin)
+            grid_painter.end()
 
+            self._grid_cache = pixmap
+            self._grid_cache_key = key
+
+        return self._grid_cache
+
+    def _draw_grid(self, painter: QPainter, origin: tuple[int, int]):
+        """
+        Draw a background grid aligned to the triangle right angle.
+
+        The grid is not anchored to (0, 0). Instead, its major/minor lines
+        pass through `origin` (the right-angle point), so the grid axes are
+        visually co-linear with the legs (catheti).
+        """
         w, h = self.width(), self.height()
         step = max(8, int(self.grid_step_px))
         major_every = max(2, int(self.grid_major_every))
 
         origin_x, origin_y = origin
 
-        # --- Vertical lines: x = origin_x + k*step ---
-        # Draw to the right
-        x = origin_x
-        i = 0
-        while x <= w:
-            painter.setPen(major if (i % major_every == 0) else minor)
-            painter.drawLine(x, 0, x, h)
-            x += step
-            i += 1
-
-        # Draw to the left
-        x = origin_x - step
-        i = 1
-        while x >= 0:
-            painter.setPen(major if (i % major_every == 0) else minor)
-            painter.drawLine(x, 0, x, h)
-            x -= step
-            i += 1
-
-        # --- Horizontal lines: y = origin_y - k*step (up) and +k*step (down) ---
-        # Draw upward
-        y = origin_y
-        i = 0
-        while y >= 0:
-            painter.setPen(major if (i % major_every == 0) else minor)
-            painter.drawLine(0, y, w, y)
-            y -= step
-            i += 1
-
-        # Draw downward
-        y = origin_y + step
-        i = 1
-        while y <= h:
-            painter.setPen(major if (i % major_every == 0) else minor)
-            painter.drawLine(0, y, w, y)
-            y += step
-            i += 1
+        # Lines are collected per pen and issued with one drawLines() call each
+        # instead of switching pens and calling drawLine() per line.
+        minor_lines: list[QLineF] = []
+        major_lines: list[QLineF] = []
+
+        # Grid coordinates are origin + k*step for every k (positive or negative)
+        # that lands inside the widget; k == 0 is the axis through the right angle
+        # and every `major_every`-th line counting from it is a major line.
+        for x in range(origin_x % step, w + 1, step):
+            is_major = (x - origin_x) // step % major_every == 0
+            (major_lines if is_major else minor_lines).append(QLineF(x, 0, x, h))
+
+        for y in range(origin_y % step, h + 1, step):
+            is_major = (y - origin_y) // step % major_every == 0
+            (major_lines if is_major else minor_lines).append(QLineF(0, y, w, y))
+
+        painter.setPen(self._pen_minor)
+        painter.drawLines(minor_lines)
+        painter.setPen(self._pen_major)
+        painter.drawLines(major_lines)
 
     def _compute_triangle_points(self, margin: int, base_y: int):
         """
@@ -158,6 +303,8 @@ class TriangleCanvas(QFrame):
         We compute a pixel `scale` so that both legs fit into the drawable area,
         then convert lengths into pixels: pixels = length * scale.
 
+        Points are QPointF; leg lengths are not truncated to whole pixels.
+
         Returns
         -------
         (point_c, point_a, point_b, scale) where:
@@ -177,15 +324,132 @@ class TriangleCanvas(QFrame):
         x0 = margin
         y0 = base_y
 
-        point_c = (x0, y0)
-        point_a = (x0 + int(b_val * scale), y0)
-        point_b = (x0, y0 - int(a_val * scale))
+        point_c = QPointF(x0, y0)
+        point_a = QPointF(x0 + b_val * scale, y0)
+        point_b = QPointF(x0, y0 - a_val * scale)
 
         return point_c, point_a, point_b, scale
 
+    def _geometry(self, margin: int, base_y: int):
+        """
+        Return the triangle geometry for the current size and result.
+
+        Cached on everything it depends on (size, margins, drawn legs), so a
+        re-render that only changes colors or labels reuses it.
+
+        Returns
+        -------
+        (point_c, outline, marker, mid_ca, mid_cb, mid_ba) where:
+        - point_c: right angle (QPointF)
+        - outline: triangle outline (QPolygonF)
+        - marker: right-angle marker lines (list of QLineF)
+        - mid_*: midpoints (QPointF) of the bottom leg, left leg and
+          hypotenuse, used to place the labels
+        """
+        # Decide whether we can draw a proportional right triangle
+        can_draw_proportional = (
+            self.has_result
+            and self.is_right
+            and self.result_a is not None
+            and self.result_b is not None
+            and self.result_c is not None
+        )
+
+        w, h = self.width(), self.height()
+        legs = (self.result_a, self.result_b) if can_draw_proportional else None
+        key = (w, h, margin, base_y, legs)
+        if self._geom_cache is not None and key == self._geom_cache_key:
+            return self._geom_cache
+
+        if can_draw_proportional:
+            # Proportional right triangle using computed legs a,b
+            point_c, point_a, point_b, _scale = self._compute_triangle_points(margin, base_y)
+        else:
+            # Placeholder: Right angle at bottom-left (C), isosceles legs
+            point_c = QPointF(margin, base_y)
+            point_a = QPointF(w - margin, base_y)
+            point_b = QPointF(margin, margin)
+
+        outline = QPolygonF((point_c, point_a, point_b))
+
+        # Right-angle marker at C, scaled to triangle size
+        leg_w = point_a.x() - point_c.x()  # b in pixels
+        leg_h = point_c.y() - point_b.y()  # a in pixels
+        min_leg = int(min(leg_w, leg_h))
+
+        # Marker must not exceed 1/4 of the smallest leg
+        ra_cap = max(3, min_leg // 4)
+        scaled = int(0.12 * min_leg)
+        ra = max(3, min(18, scaled, ra_cap))
+
+        ra_x = point_c + QPointF(ra, 0)    # along the base
+        ra_y = point_c - QPointF(0, ra)    # along the vertical leg
+        ra_xy = point_c + QPointF(ra, -ra)
+        marker = [
+            QLineF(point_c, ra_x),
+            QLineF(point_c, ra_y),
+            QLineF(ra_x, ra_xy),
+            QLineF(ra_y, ra_xy),
+        ]
+
+        # Midpoints for labels
+        mid_ca = QLineF(point_c, point_a).center()  # bottom leg
+        mid_cb = QLineF(point_c, point_b).center()  # left leg
+        mid_ba = QLineF(point_b, point_a).center()  # hypotenuse
+
+        self._geom_cache = (point_c, outline, marker, mid_ca, mid_cb, mid_ba)
+        self._geom_cache_key = key
+        return self._geom_cache
+
     def paintEvent(self, event):
         """
-        Render the canvas.
+        Paint the canvas from the cached frame pixmap.
+
+        The frame (grid, triangle, labels) is re-rendered by `_render()` only when
+        something that affects it has changed; idle repaints (focus, expose, ...)
+        are a single pixmap blit.
+
+        The widget is opaque (WA_OpaquePaintEvent), so the background is filled
+        here rather than by Qt before every paint.
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._bg)
+        # QFrame border, drawn with this painter instead of QFrame.paintEvent
+        # (which would open a second one)
+        self.drawFrame(painter)
+        painter.drawPixmap(0, 0, self._frame_pixmap())
+        painter.end()
+
+    def _new_pixmap(self) -> QPixmap:
+        """Create a transparent pixmap covering the widget at the device pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+
+    def _frame_pixmap(self) -> QPixmap:
+        """Return the fully rendered canvas content, re-rendering it only when its key changes."""
+        key = (
+            self.width(), self.height(), self.devicePixelRatioF(),
+            self._fg.rgba(),
+            self.has_result, self.is_right, self.result_a, self.result_b, self.result_c,
+            self.grid_enabled, self.grid_step_px, self.grid_major_every,
+        )
+        if self._frame_cache is None or key != self._frame_cache_key:
+            pixmap = self._new_pixmap()
+            frame_painter = QPainter(pixmap)
+            self._render(frame_painter)
+            frame_painter.end()
+
+            self._frame_cache = pixmap
+            self._frame_cache_key = key
+
+        return self._frame_cache
+
+    def _render(self, painter: QPainter):
+        """
+        Render the canvas content (everything except the QFrame border).
 
         Rendering flow (high-level)
         ---------------------------
@@ -194,149 +458,133 @@ class TriangleCanvas(QFrame):
         3) Choose triangle geometry:
            - draw proportional right triangle only when we have a valid RIGHT result,
            - otherwise draw a placeholder (isosceles) triangle.
-        4) Draw the grid aligned to the right-angle point (point_c).
+        4) Draw the grid aligned to the right-angle point (point_c), blitted
+           from a cached pixmap.
         5) Draw triangle edges and the right-angle marker (marker size is constrained).
         6) Draw labels:
            - b: centered under the base line,
            - c: near hypotenuse midpoint (anchored to avoid overlap),
            - a: vertical along the left leg with ellipsis for long values.
         """
-        super().paintEvent(event)
-
-        painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        palette = self.palette()
-        text_color = palette.color(self.foregroundRole())
-
         w, h = self.width(), self.height()
         margin = 40
 
         # Labels font (used also for metrics like ascent/height)
-        painter.setFont(QFont("Arial", 12))
-        painter.setPen(text_color)
-        fm = painter.fontMetrics()
+        painter.setFont(self._label_font)
+        painter.setPen(self._pen_text)
+        fm = self._label_fm
 
-        def clamp(val: int, lo: int, hi: int) -> int:
+        def clamp(val: float, lo: float, hi: float) -> float:
             return max(lo, min(val, hi))
 
-        def fmt(name: str, value) -> str:
-            """Build label like 'b = 12.34' or just 'b' if value missing."""
-            if not self.has_result or value is None:
-                return name
-            return f"{name} = {value:g}"
-
-        def draw_centered_elided_text(x_center: int, y: int, text: str, max_width: int):
+        def draw_centered_elided_text(x_center: float, y: float, text: str, max_width: int):
             """Draw elided text centered around x_center."""
-            elided = fm.elidedText(text, Qt.ElideRight, max_width)
-            text_w = fm.horizontalAdvance(elided)
-            painter.drawText(x_center - text_w // 2, y, elided)
+            elided, text_w = self._elide(text, max_width)
+            painter.drawText(QPointF(x_center - text_w // 2, y), elided)
 
-        def draw_elided_text(x: int, y: int, text: str, max_width: int):
+        def draw_elided_text(x: float, y: float, text: str, max_width: int):
             """Draw elided text anchored at x,y (baseline)."""
-            elided = fm.elidedText(text, Qt.ElideRight, max_width)
-            painter.drawText(x, y, elided)
+            elided, _text_w = self._elide(text, max_width)
+            painter.drawText(QPointF(x, y), elided)
 
         # Lift the base
         gap = max(6, self.grid_step_px // 2)
         needed = fm.height() + gap
         base_y = h - margin - min(needed, margin)
 
-        # Decide whether we can draw a proportional right triangle
-        can_draw_proportional = (
-            self.has_result
-            and self.is_right
-            and self.result_a is not None
-            and self.result_b is not None
-            and self.result_c is not None
-        )
-
-        if can_draw_proportional:
-            # Proportional right triangle using computed legs a,b
-            point_c, point_a, point_b, _scale = self._compute_triangle_points(margin, base_y)
-        else:
-            # Placeholder: Right angle at bottom-left (C), isosceles legs
-            point_c = (margin, base_y)
-            point_a = (w - margin, base_y)
-            point_b = (margin, margin)
+        point_c, outline, marker, mid_ca, mid_cb, mid_ba = self._geometry(margin, base_y)
 
-        # Background grid aligned to the triangle right angle (point_c)
-        self._draw_grid(painter, origin=point_c)
+        # Background grid aligned to the triangle right angle (point_c);
+        # point_c is always on whole pixels (margin, base_y)
+        if self.grid_enabled:
+            painter.drawPixmap(0, 0, self._grid_pixmap((int(point_c.x()), int(point_c.y()))))
 
-        # Triangle edges
-        tri_pen = QPen(text_color, 2)
-        painter.setPen(tri_pen)
+        # Triangle edges: one closed outline (base b, hypotenuse c, vertical a)
+        painter.setPen(self._pen_tri)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPolygon(outline)
 
-        # Draw triangle edges
-        painter.drawLine(point_c[0], point_c[1], point_a[0], point_a[1])  # base (leg b)
-        painter.drawLine(point_c[0], point_c[1], point_b[0], point_b[1])  # vertical (leg a)
-        painter.drawLine(point_b[0], point_b[1], point_a[0], point_a[1])  # hypotenuse (c)
+        # Right-angle marker at C
+        painter.setPen(self._pen_ra)
+        painter.drawLines(marker)
 
-        # Right-angle marker at C, scaled to triangle size
-        leg_w = abs(point_a[0] - point_c[0])  # b in pixels (int)
-        leg_h = abs(point_c[1] - point_b[1])  # a in pixels (int)
-        min_leg = min(leg_w, leg_h)
-
-        # Marker must not exceed 1/4 of the smallest leg
-        ra_cap = max(3, min_leg // 4)
-        scaled = int(0.12 * min_leg)
-        ra = max(3, min(18, scaled, ra_cap))
-
-        ra_pen = QPen(text_color, 3)
-        painter.setPen(ra_pen)
-
-        painter.drawLine(point_c[0], point_c[1], point_c[0] + ra, point_c[1])
-        painter.drawLine(point_c[0], point_c[1], point_c[0], point_c[1] - ra)
-        painter.drawLine(point_c[0] + ra, point_c[1], point_c[0] + ra, point_c[1] - ra)
-        painter.drawLine(point_c[0], point_c[1] - ra, point_c[0] + ra, point_c[1] - ra)
-
-        # Labels font
-        painter.setFont(QFont("Arial", 12))
-        painter.setPen(text_color)
-
-        # Midpoints for labels
-        mid_ca = ((point_c[0] + point_a[0]) // 2, (point_c[1] + point_a[1]) // 2)  # bottom leg
-        mid_cb = ((point_c[0] + point_b[0]) // 2, (point_c[1] + point_b[1]) // 2)  # left leg
-        mid_ba = ((point_b[0] + point_a[0]) // 2, (point_b[1] + point_a[1]) // 2)  # hypotenuse
+        # Labels (the label font is still active on the painter)
+        painter.setPen(self._pen_text)
 
         # --- b label: MUST be BELOW the b-line ---
-        b_text = fmt("b", self.result_b)
+        b_text = self._label_b
 
-        line_y = mid_ca[1]
+        line_y = mid_ca.y()
         b_y = line_y + gap + fm.ascent()
         b_y = clamp(b_y, margin + fm.ascent(), h - margin // 2)
 
-        b_max_left = mid_ca[0] - 5
-        b_max_right = w - 5 - mid_ca[0]
-        b_max_w = max(60, 2 * min(b_max_left, b_max_right))
+        b_max_left = mid_ca.x() - 5
+        b_max_right = w - 5 - mid_ca.x()
+        b_max_w = int(max(60, 2 * min(b_max_left, b_max_right)))
 
-        draw_centered_elided_text(mid_ca[0], b_y, b_text, max_width=b_max_w)
+        draw_centered_elided_text(mid_ca.x(), b_y, b_text, max_width=b_max_w)
 
         # --- c label: anchored near midpoint (do not center) to avoid overlapping the slanted side ---
-        c_text = fmt("c", self.result_c)
-        c_x = clamp(mid_ba[0] + 10, 5, w - margin)
-        c_y = clamp(mid_ba[1] - 10, margin, h - 5)
-        draw_elided_text(c_x, c_y, c_text, max_width=w - c_x - 5)
+        c_text = self._label_c
+        c_x = clamp(mid_ba.x() + 10, 5, w - margin)
+        c_y = clamp(mid_ba.y() - 10, margin, h - 5)
+        draw_elided_text(c_x, c_y, c_text, max_width=int(w - c_x - 5))
 
         # --- a label: vertical text along the left leg (better for long values), centered ---
-        a_text = fmt("a", self.result_a)
+        a_text = self._label_a
 
         painter.save()
-        a_x = clamp(mid_cb[0] - 25, 5, w - 5)
-        a_y = clamp(mid_cb[1] + 10, margin, h - margin)
+        a_x = clamp(mid_cb.x() - 25, 5, w - 5)
+        a_y = clamp(mid_cb.y() + 10, margin, h - margin)
 
         painter.translate(a_x, a_y)
         painter.rotate(-90)
 
         max_w_rot = max(60, h - 2 * margin)
-        elided_a = fm.elidedText(a_text, Qt.ElideRight, max_w_rot)
-        a_text_w = fm.horizontalAdvance(elided_a)
+        elided_a, a_text_w = self._elide(a_text, max_w_rot)
 
         # Center the vertical text around the rotation origin
-        painter.drawText(-a_text_w // 2, 0, elided_a)
+        painter.drawText(QPointF(-a_text_w // 2, 0), elided_a)
         painter.restore()
 
 
+@lru_cache(maxsize=128)
+def _cached_proceed(a_txt: str, b_txt: str, c_txt: str) -> core.TriangleData:
+    """
+    Memoized `core.proceed_data` for normalized input texts.
+
+    The result depends only on the three texts, so repeated clicks with the
+    same input reuse it. The returned TriangleData is shared between calls
+    and must be treated as read-only.
+    """
+    return core.proceed_data({"a": a_txt, "b": b_txt, "c": c_txt})
+
+
+class _CalcTask(QRunnable):
+    """
+    Run `_cached_proceed(*payload)` on a QThreadPool worker.
+
+    The resulting TriangleData is emitted through `done` (MainWindow.calc_done);
+    the connection is queued, so the receiver runs on the UI thread. If the
+    calculation raises, an invalid TriangleData carrying the error message is
+    emitted instead, so the UI always gets a result and never stays busy.
+    """
+    def __init__(self, payload: tuple[str, str, str], done):
+        super().__init__()
+        self._payload = payload
+        self._done = done
+
+    def run(self):
+        try:
+            result = _cached_proceed(*self._payload)
+        except Exception as exc:  # report on the UI instead of losing it in the worker
+            traceback.print_exc()
+            result = core.TriangleData(is_valid=False, is_right=False, message=f"Calculation failed: {exc}")
+        self._done.emit(result)
+
+
 class MainWindow(QWidget):
     """
     Main application window.
@@ -352,8 +600,25 @@ class MainWindow(QWidget):
     - Display the returned status message and (when possible) numeric results on the canvas.
     - Show one computed output field only in CALCULATE mode.
     """
+    # Guidance messages, wrapped once here instead of on every keystroke
+    _STATUS_2_FIELDS = _wrap_sentences(
+        "Leave the field empty for the value you want to compute (a, b, or c)."
+    )
+    _STATUS_3_FIELDS = _wrap_sentences(
+        "Click 'Verify' to check whether the triangle is right-angled. "
+        "Input will be sorted: largest will be treated as hypotenuse."
+    )
+    _STATUS_EMPTY = _wrap_sentences("Enter two values to compute or three to verify")
+
+    # Emitted (from a worker thread) with the TriangleData of a click
+    calc_done = Signal(object)
+
     def __init__(self):
         super().__init__()
+        # When True, input changes must NOT overwrite the last result message.
+        # Set before any signal is connected; the slots read it directly.
+        self._showing_result = False
+
         self.setWindowTitle("Pythagoras Tool")
         self.resize(720, 520)
 
@@ -361,71 +626,63 @@ class MainWindow(QWidget):
         self.output_font = QFont("Monospace")
         self.output_font.setStyleHint(QFont.Monospace)
 
-        # Styles (neutral, theme-independent)
-        self.output_field_style = """
-        QLineEdit {
-            background-color: #3a3a3a;
-            color: #ffffff;
-            border: 1px solid #6a6a6a;
-            border-radius: 6px;
-            padding: 6px 10px;
-            font-weight: 600;
-        }
-        QLineEdit:focus {
-            border: 1px solid #8fb2ff;
-        }
-        """
-
-        self.output_label_style = """
-        QLabel {
-            font-weight: 600;
-        }
-        """
+        # Which of the a/b/c fields currently hold non-blank text (see _update_filled).
+        # Fed by textEdited, i.e. user edits only; programmatic changes such as
+        # _clear_inputs() do not emit it and reset the flags themselves.
+        self._nonempty = [False, False, False]
+        # Filled count the button/status currently reflect (see _apply_input_changed)
+        self._last_filled = 0
+
+        # Debounce for on_input_changed (see there)
+        self._input_timer = QTimer(self)
+        self._input_timer.setSingleShot(True)
+        self._input_timer.setInterval(50)
+        self._input_timer.timeout.connect(self._apply_input_changed)
+
+        # Raw a/b/c texts of the click whose result is pending (see _on_calc_done)
+        self._pending_raw: tuple[str, str, str] = ("", "", "")
+        # True from submitting a calculation until its result is shown
+        self._busy = False
+        self.calc_done.connect(self._on_calc_done)
 
         layout = QVBoxLayout(self)
+        # Widgets are created first and added below in one pass; the layout
+        # is activated once at the end instead of after every addWidget().
+        layout.setEnabled(False)
 
         # --- Drawing area (placeholder visible from the start) ---
         self.canvas = TriangleCanvas()
         self.canvas.show_placeholder()
-        layout.addWidget(self.canvas)
-
-        # --- Input row with labels before fields ---
-        input_row = QHBoxLayout()
 
+        # --- Input fields ---
         # a (leg)
-        input_row.addWidget(QLabel("a:"))
         self.a_edit = QLineEdit()
         self.a_edit.setPlaceholderText("leg")
-        self.a_edit.textChanged.connect(self.on_input_changed)
-        input_row.addWidget(self.a_edit)
+        self.a_edit.textEdited.connect(lambda text: self._update_filled(0, text))
 
         # b (leg)
-        input_row.addWidget(QLabel("b:"))
         self.b_edit = QLineEdit()
         self.b_edit.setPlaceholderText("leg")
-        self.b_edit.textChanged.connect(self.on_input_changed)
-        input_row.addWidget(self.b_edit)
+        self.b_edit.textEdited.connect(lambda text: self._update_filled(1, text))
 
         # c (hypotenuse)
-        input_row.addWidget(QLabel("c:"))
         self.c_edit = QLineEdit()
         self.c_edit.setPlaceholderText("hypotenuse")
-        self.c_edit.textChanged.connect(self.on_input_changed)
-        input_row.addWidget(self.c_edit)
+        self.c_edit.textEdited.connect(lambda text: self._update_filled(2, text))
 
         # --- Status message ---
-        self.status_label = QLabel("Enter two values to compute or three to verify")
+        self.status_label = QLabel(self._STATUS_EMPTY)
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setFont(QFont("Arial", 16))
         self.status_label.setWordWrap(True)
-        layout.addWidget(self.status_label)
+        # Text currently shown in status_label (see _set_status)
+        self._last_status = self._STATUS_EMPTY
 
         # --- Computed output field (shown only after a successful CALCULATE) ---
         output_row = QHBoxLayout()
         output_row.setSpacing(8)
 
         self.computed_out_label = QLabel("—")
-        self.computed_out_label.setStyleSheet(self.output_label_style)
         output_row.addWidget(self.computed_out_label)
 
         self.computed_out = self._create_output_field()
@@ -434,27 +691,42 @@ class MainWindow(QWidget):
         output_row.setStretchFactor(self.computed_out, 1)
 
         self.output_container = QWidget()
+        self.output_container.setObjectName("outputContainer")
+        # One stylesheet for the whole output row instead of one per widget
+        self.output_container.setStyleSheet(_OUTPUT_STYLE + _LABEL_STYLE)
         self.output_container.setLayout(output_row)
         self.output_container.setVisible(False)
-        layout.addWidget(self.output_container)
 
         # Action button
         self.action_button = QPushButton("—")
         self.action_button.setEnabled(False)
+        # Current button state (see _set_button)
+        self._button_enabled = False
+        self._button_text = "—"
         self.action_button.clicked.connect(self.on_action_clicked)
-        input_row.addWidget(self.action_button)
 
+        # --- Input row with labels before fields ---
+        input_row = QHBoxLayout()
+        for widget in (
+            QLabel("a:"), self.a_edit,
+            QLabel("b:"), self.b_edit,
+            QLabel("c:"), self.c_edit,
+            self.action_button,
+        ):
+            input_row.addWidget(widget)
+
+        for widget in (self.canvas, self.status_label, self.output_container):
+            layout.addWidget(widget)
         layout.addLayout(input_row)
 
-        # When True, input changes must NOT overwrite the last result message.
-        self._showing_result = False
+        layout.setEnabled(True)
+        layout.activate()
 
     def _create_output_field(self) -> QLineEdit:
         """Create a read-only output field for the computed value."""
         field = QLineEdit()
         field.setReadOnly(True)
         field.setFont(self.output_font)
-        field.setStyleSheet(self.output_field_style)
         field.setFocusPolicy(Qt.StrongFocus)  # allow selection + Ctrl+C
         field.setMinimumWidth(140)
         return field
@@ -464,52 +736,68 @@ class MainWindow(QWidget):
         Normalize user input before passing it to core:
         - strips spaces
         - converts decimal comma to dot (e.g., '3,5' -> '3.5')
+        - removes no-break/thin spaces used as group separators (e.g., '1\u00A0000' -> '1000')
         """
-        return txt.strip().replace(",", ".")
+        s = txt.strip()
+        # Plain ASCII input without a comma (the common case) needs no translation
+        if s.isascii() and "," not in s:
+            return s
+        return s.translate(_NORMALIZE_TABLE)
 
     def _filled_count(self) -> int:
         """Return how many of the three fields contain non-empty text."""
-        values = (
-            self.a_edit.text().strip(),
-            self.b_edit.text().strip(),
-            self.c_edit.text().strip(),
-        )
-        return sum(bool(v) for v in values)
+        return sum(self._nonempty)
 
-    def _sentence_wrap(self, text: str) -> str:
+    def _update_filled(self, index: int, text: str) -> None:
         """
-        Make the status output more readable by putting each sentence on a new line.
-
-        We split only when a sentence-ending punctuation is followed by whitespace:
-            '.', '!' or '?' + whitespace -> newline
+        Track whether field `index` (0=a, 1=b, 2=c) is non-empty.
 
-        This avoids breaking:
-        - decimal numbers: 3.14 (no whitespace after '.')
-        - scientific notation: 1e-3
-        - version-like tokens: v1.2.3 (no whitespace)
+        The button state only depends on the number of filled fields, so an
+        update is scheduled only when a field switches between empty and filled.
         """
-        text = (text or "").strip()
-        if not text:
-            return ""
-        return re.sub(r'([.!?])\s+', r'\1\n', text)
+        now = bool(text.strip())
+        if now != self._nonempty[index]:
+            self._nonempty[index] = now
+            self.on_input_changed()
 
     def _clear_inputs(self) -> None:
         """Clear input fields after an action click, without overwriting the result message."""
-        self.a_edit.blockSignals(True)
-        self.b_edit.blockSignals(True)
-        self.c_edit.blockSignals(True)
-
+        # clear() does not emit textEdited, so no input update is triggered
         self.a_edit.clear()
         self.b_edit.clear()
         self.c_edit.clear()
-
-        self.a_edit.blockSignals(False)
-        self.b_edit.blockSignals(False)
-        self.c_edit.blockSignals(False)
+        self._nonempty = [False, False, False]
+        self._last_filled = 0
 
         # Reset the button state, but DO NOT touch status_label here.
-        self.action_button.setEnabled(False)
-        self.action_button.setText("—")
+        self._set_button(False, "—")
+
+    def _set_busy(self, busy: bool) -> None:
+        """
+        Mark a calculation as pending (or finished).
+
+        The inputs are read-only while busy: edits made during the calculation
+        would re-enable the button and then be wiped by `_clear_inputs` when
+        the result arrives.
+        """
+        self._busy = busy
+        for edit in (self.a_edit, self.b_edit, self.c_edit):
+            edit.setReadOnly(busy)
+
+    def _set_status(self, text: str) -> None:
+        """Show `text` in the status label; an unchanged text is not set again (no re-layout)."""
+        if text != self._last_status:
+            self.status_label.setText(text)
+            self._last_status = text
+
+    def _set_button(self, enabled: bool, text: str) -> None:
+        """Set the action button state; unchanged values are not set again."""
+        if enabled != self._button_enabled:
+            self.action_button.setEnabled(enabled)
+            self._button_enabled = enabled
+        if text != self._button_text:
+            self.action_button.setText(text)
+            self._button_text = text
 
     def _hide_outputs(self) -> None:
         """Hide computed output container and clear its content."""
@@ -523,51 +811,92 @@ class MainWindow(QWidget):
         self.computed_out_label.setText(f"{key}:")
         self.computed_out.setText(f"{value:g}")
 
+    @Slot()
     def on_input_changed(self):
         """
-        Update button state and guidance message whenever input changes.
+        Schedule a button/status update after input changes.
+
+        Bursts of edits (typing, paste, holding backspace) are coalesced by a
+        single-shot timer, so `_apply_input_changed` runs once per burst.
+        The first edit after a result replaces the result message, so it is
+        applied immediately.
+        """
+        if self._showing_result:
+            self._input_timer.stop()
+            self._apply_input_changed()
+            return
+        self._input_timer.start()
+
+    @Slot()
+    def _apply_input_changed(self):
+        """
+        Update button state and guidance message for the current input.
 
         Button text rules:
         - filled == 2 -> enabled, 'Calculate'
         - filled == 3 -> enabled, 'Verify'
         - else        -> disabled, '—'
         """
-        if getattr(self, "_showing_result", False):
-            any_text = any((
-                self.a_edit.text().strip(),
-                self.b_edit.text().strip(),
-                self.c_edit.text().strip(),
-            ))
-            if not any_text:
+        filled = self._filled_count()
+
+        if self._showing_result:
+            # Keep the result message until some field holds text again
+            if not filled:
                 return
             self._showing_result = False
+        elif filled == self._last_filled:
+            return  # same bucket as last applied: button and status are up to date
 
-        filled = self._filled_count()
+        self._last_filled = filled
 
         if filled == 2:
-            self.action_button.setEnabled(True)
-            self.action_button.setText("Calculate")
-            self.status_label.setText(self._sentence_wrap(
-                "Leave the field empty for the value you want to compute (a, b, or c)."
-            ))
+            self._set_button(True, "Calculate")
+            self._set_status(self._STATUS_2_FIELDS)
             return
 
         if filled == 3:
-            self.action_button.setEnabled(True)
-            self.action_button.setText("Verify")
-            self.status_label.setText(self._sentence_wrap(
-                "Click 'Verify' to check whether the triangle is right-angled. "
-                "Input will be sorted: largest will be treated as hypotenuse."
-            ))
+            self._set_button(True, "Verify")
+            self._set_status(self._STATUS_3_FIELDS)
             return
 
-        self.action_button.setEnabled(False)
-        self.action_button.setText("—")
-        self.status_label.setText(self._sentence_wrap("Enter two values to compute or three to verify"))
+        self._set_button(False, "—")
+        self._set_status(self._STATUS_EMPTY)
 
+    @Slot()
     def on_action_clicked(self):
         """
-        Read inputs -> call core -> show results.
+        Read inputs and submit the calculation to the thread pool.
+
+        `core.proceed_data` runs off the UI thread; the result is shown by
+        `_on_calc_done`. The button is disabled until then, and further clicks
+        are ignored while a calculation is pending.
+        """
+        if self._busy:
+            return
+
+        # The click reads the fields directly; a pending input update is obsolete
+        self._input_timer.stop()
+
+        # Keep raw texts to detect the mode when the result arrives
+        a_raw = self.a_edit.text().strip()
+        b_raw = self.b_edit.text().strip()
+        c_raw = self.c_edit.text().strip()
+        self._pending_raw = (a_raw, b_raw, c_raw)
+
+        payload = (
+            self._normalized_text(a_raw),
+            self._normalized_text(b_raw),
+            self._normalized_text(c_raw),
+        )
+
+        self._set_busy(True)
+        self._set_button(False, self._button_text)
+        QThreadPool.globalInstance().start(_CalcTask(payload, self.calc_done))
+
+    @Slot(object)
+    def _on_calc_done(self, result: core.TriangleData):
+        """
+        Show the result of the click submitted by `on_action_clicked`.
 
         - Status shows ONLY core message, formatted into sentences-per-line.
         - Canvas displays exactly the values returned by core.
@@ -575,21 +904,15 @@ class MainWindow(QWidget):
         - Computed output field is shown only in CALCULATE mode (2 inputs),
           and the missing side is inferred by which input field was empty.
         """
-        # Detect mode BEFORE clearing inputs
-        a_raw = self.a_edit.text().strip()
-        b_raw = self.b_edit.text().strip()
-        c_raw = self.c_edit.text().strip()
-        filled = sum(bool(v) for v in (a_raw, b_raw, c_raw))
+        self._set_busy(False)
 
-        a_txt = self._normalized_text(a_raw)
-        b_txt = self._normalized_text(b_raw)
-        c_txt = self._normalized_text(c_raw)
-
-        result = core.proceed_data({"a": a_txt, "b": b_txt, "c": c_txt})
+        # Mode as detected at click time
+        a_raw, b_raw, c_raw = self._pending_raw
+        filled = sum(bool(v) for v in (a_raw, b_raw, c_raw))
 
         # Lock status to keep result visible
         self._showing_result = True
-        self.status_label.setText(self._sentence_wrap(result.message))
+        self._set_status(_wrap_sentences(result.message))
 
         # Canvas must display exactly what core returned
         if result.is_valid and result.a is not None and result.b is not None and result.c is not None:
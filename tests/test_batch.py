@@ -0,0 +1,109 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pathagoras import batch, core
+
+NAN = math.nan
+
+
+def test_proceed_data_batch_solve_and_verify_rows():
+    result = batch.proceed_data_batch(
+        a=[3.0, NAN, 3.0, 4.0, 2.0],
+        b=[4.0, 4.0, NAN, 5.0, 3.0],
+        c=[NAN, 5.0, 5.0, 3.0, 4.0],
+        missing=[batch.MISSING_C, batch.MISSING_A, batch.MISSING_B, batch.MISSING_NONE, batch.MISSING_NONE],
+    )
+
+    assert result.a == pytest.approx([3.0, 3.0, 3.0, 3.0, 2.0])
+    assert result.b == pytest.approx([4.0, 4.0, 4.0, 4.0, 3.0])
+    assert result.c == pytest.approx([5.0, 5.0, 5.0, 5.0, 4.0])
+    assert result.is_valid.tolist() == [True, True, True, True, True]
+    assert result.is_right.tolist() == [True, True, True, True, False]
+
+
+@pytest.mark.parametrize(
+    "a,b,c,missing",
+    [
+        (6.0, NAN, 5.0, batch.MISSING_B),     # known leg greater than c
+        (1.0, 2.0, 3.0, batch.MISSING_NONE),  # impossible triangle
+        (0.0, 4.0, NAN, batch.MISSING_C),     # non-positive value
+        (-1.0, 4.0, NAN, batch.MISSING_C),
+        (math.inf, 4.0, NAN, batch.MISSING_C),  # non-finite value
+        (NAN, 4.0, NAN, batch.MISSING_C),
+        (3.0, 4.0, 5.0, 7),                   # unknown mode code
+    ],
+)
+def test_proceed_data_batch_invalid_rows(a, b, c, missing):
+    result = batch.proceed_data_batch([a], [b], [c], [missing])
+    assert result.is_valid.tolist() == [False]
+    assert result.is_right.tolist() == [False]
+
+
+def test_proceed_data_batch_matches_scalar_proceed_data():
+    rows = [
+        ({"a": "5", "b": "12", "c": ""}, batch.MISSING_C),
+        ({"a": "", "b": "12", "c": "13"}, batch.MISSING_A),
+        ({"a": "8", "b": "", "c": "17"}, batch.MISSING_B),
+        ({"a": "1e9", "b": "1e9", "c": str(math.sqrt(2) * 1e9)}, batch.MISSING_NONE),
+        ({"a": "7", "b": "5", "c": "6"}, batch.MISSING_NONE),
+    ]
+    a, b, c = ([float(data[k] or NAN) for data, _ in rows] for k in "abc")
+    missing = [code for _, code in rows]
+
+    result = batch.proceed_data_batch(a, b, c, missing)
+
+    for i, (data, _) in enumerate(rows):
+        expected = core.proceed_data(dict(data))
+        assert (result.a[i], result.b[i], result.c[i]) == pytest.approx((expected.a, expected.b, expected.c))
+        assert bool(result.is_valid[i]) is expected.is_valid
+        assert bool(result.is_right[i]) is expected.is_right
+
+
+def test_proceed_data_batch_does_not_modify_inputs():
+    a = np.array([4.0])
+    b = np.array([5.0])
+    c = np.array([3.0])
+    batch.proceed_data_batch(a, b, c, np.array([batch.MISSING_NONE]))
+    assert (a[0], b[0], c[0]) == (4.0, 5.0, 3.0)
+
+
+def test_proceed_data_batch_shape_mismatch_raises():
+    with pytest.raises(ValueError):
+        batch.proceed_data_batch([3.0, 4.0], [4.0], [NAN], [batch.MISSING_C])
+
+
+def test_proceed_data_batch_solves_integer_triples_exactly():
+    result = batch.proceed_data_batch(
+        a=[3.0, NAN, 15.0, 27.0],
+        b=[NAN, 5.0, NAN, NAN],
+        c=[5.0, 13.0, 17.0, 45.0],
+        missing=[batch.MISSING_B, batch.MISSING_A, batch.MISSING_B, batch.MISSING_B],
+    )
+    assert result.b[[0, 2, 3]].tolist() == [4.0, 8.0, 36.0]
+    assert result.a[1] == 12.0
+
+
+def test_proceed_data_batch_solves_legs_at_extreme_magnitudes():
+    result = batch.proceed_data_batch(
+        a=[3e200, NAN, 3e-200],
+        b=[NAN, 4e200, NAN],
+        c=[5e200, 5e200, 5e-200],
+        missing=[batch.MISSING_B, batch.MISSING_A, batch.MISSING_B],
+    )
+    assert result.is_valid.tolist() == [True, True, True]
+    assert result.b[[0, 2]] == pytest.approx([4e200, 4e-200])
+    assert result.a[1] == pytest.approx(3e200)
+
+
+def test_proceed_data_batch_verifies_right_triangles_at_extreme_magnitudes():
+    result = batch.proceed_data_batch(
+        a=[3e200, 3e-200, 3e200],
+        b=[4e200, 4e-200, 5e200],
+        c=[5e200, 5e-200, 6e200],
+        missing=[batch.MISSING_NONE] * 3,
+    )
+    assert result.is_valid.tolist() == [True, True, True]
+    assert result.is_right.tolist() == [True, True, False]
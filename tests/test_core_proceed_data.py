@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import pytest
 
 from pathagoras import core
@@ -22,7 +24,7 @@ def test_proceed_data_rejects_wrong_keys_but_does_not_raise():
 )
 
 def test_proceed_data_invalid_input_returns_message_no_raise(data):
-    result = core.proceed_data(dict(data))
+    result = core.proceed_data(data)
 
     assert isinstance(result, core.TriangleData)
     assert result.is_valid is False
@@ -30,6 +32,18 @@ def test_proceed_data_invalid_input_returns_message_no_raise(data):
     assert isinstance(result.message, str) and result.message
 
 
+def test_proceed_data_does_not_modify_input():
+    data = {"a": " 3 ", "b": "4", "c": ""}
+    core.proceed_data(data)
+    assert data == {"a": " 3 ", "b": "4", "c": ""}
+
+
+def test_proceed_data_accepts_read_only_mapping():
+    result = core.proceed_data(MappingProxyType({"a": "3", "b": "4", "c": ""}))
+    assert result.is_valid is True
+    assert result.c == pytest.approx(5.0)
+
+
 def test_proceed_data_more_than_one_missing_rejected():
     result = core.proceed_data({"a": "", "b": "", "c": "5"})
     assert result.is_valid is False
@@ -107,3 +121,24 @@ def test_proceed_data_invalid_values_return_error(data, expected_substring):
     assert result.is_valid is False
     assert result.is_right is False
     assert expected_substring in result.message
+
+
+def test_proceed_data_solve_leg_integer_triple_is_exact():
+    assert core.proceed_data({"a": "3", "b": "", "c": "5"}).b == 4.0
+    assert core.proceed_data({"a": "", "b": "5", "c": "13"}).a == 12.0
+
+
+def test_proceed_data_solve_leg_extreme_magnitude():
+    result = core.proceed_data({"a": "3e200", "b": "", "c": "5e200"})
+    assert result.is_valid is True
+    assert result.b == pytest.approx(4e200)
+
+
+def test_proceed_data_verifies_its_own_solution_at_extreme_magnitude():
+    solved = core.proceed_data({"a": "3e200", "b": "4e200", "c": ""})
+    assert solved.is_right is True
+
+    verified = core.proceed_data({"a": "3e200", "b": "4e200", "c": repr(solved.c)})
+    assert verified.is_valid is True
+    assert verified.is_right is True
+    assert "Triangle is RIGHT" in verified.message
@@ -1,9 +1,19 @@
+import itertools
 import math
+from fractions import Fraction
+
 import pytest
 
 from pathagoras import core
 
 
+def test_triangle_data_uses_slots():
+    t = core.TriangleData()
+    assert not hasattr(t, "__dict__")
+    with pytest.raises(AttributeError):
+        t.d = 1.0
+
+
 def test_compute_hypotenuse_ok_sets_flags():
     t = core.TriangleData(a=3.0, b=4.0)
     t.compute_hypotenuse()
@@ -13,6 +23,19 @@ def test_compute_hypotenuse_ok_sets_flags():
     assert t.is_right is True
 
 
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        (3e200, 4e200, 5e200),        # a*a + b*b would overflow to inf
+        (3e-200, 4e-200, 5e-200),     # a*a + b*b would underflow to 0
+    ],
+)
+def test_compute_hypotenuse_extreme_magnitudes(a, b, expected):
+    t = core.TriangleData(a=a, b=b)
+    t.compute_hypotenuse()
+    assert t.c == pytest.approx(expected)
+
+
 @pytest.mark.parametrize(
     "a,b",
     [
@@ -46,6 +69,41 @@ def test_compute_leg_ok(c, a, b, expected_a, expected_b):
     assert t.is_right is True
 
 
+@pytest.mark.parametrize(
+    "c,a,expected_b",
+    [
+        (5e200, 3e200, 4e200),        # (c - a) * (c + a) would overflow to inf
+        (5e-200, 3e-200, 4e-200),     # (c - a) * (c + a) would underflow to 0
+    ],
+)
+def test_compute_leg_extreme_magnitudes(c, a, expected_b):
+    t = core.TriangleData(a=a, b=None, c=c)
+    t.compute_leg()
+    assert t.b == pytest.approx(expected_b)
+
+
+@pytest.mark.parametrize("c,a,expected_b", [(5.0, 3.0, 4.0), (13.0, 5.0, 12.0)])
+def test_compute_leg_integer_triple_is_exact(c, a, expected_b):
+    t = core.TriangleData(a=a, b=None, c=c)
+    t.compute_leg()
+    assert t.b == expected_b
+
+
+def test_compute_leg_known_equal_to_hypotenuse_gives_zero():
+    t = core.TriangleData(a=5.0, b=None, c=5.0)
+    t.compute_leg()
+    assert t.b == 0.0
+
+
+def test_compute_leg_needle_triangle_is_stable():
+    # leg very close to the hypotenuse: c*c - a*a would lose most digits
+    c = 1.0 + 1e-8
+    t = core.TriangleData(a=1.0, b=None, c=c)
+    t.compute_leg()
+    exact = math.sqrt(float(Fraction(c) ** 2 - 1))
+    assert t.b == pytest.approx(exact, rel=1e-12)
+
+
 def test_compute_leg_missing_c_raises():
     t = core.TriangleData(a=3.0, b=None, c=None)
     with pytest.raises(ValueError):
@@ -71,10 +129,11 @@ def test_compute_leg_known_greater_than_hypotenuse_raises():
         t.compute_leg()
 
 
-def test_normalise_sorts_sides():
-    t = core.TriangleData(a=4.0, b=5.0, c=3.0)
+@pytest.mark.parametrize("sides", list(itertools.permutations((3.0, 4.0, 5.0))) + [(2.0, 2.0, 1.0)])
+def test_normalise_sorts_sides(sides):
+    t = core.TriangleData(*sides)
     t.normalise()
-    assert (t.a, t.b, t.c) == (3.0, 4.0, 5.0)
+    assert (t.a, t.b, t.c) == tuple(sorted(sides))
 
 
 def test_normalise_missing_raises():
@@ -129,3 +188,41 @@ def test_is_right_triangle_tolerance_large_scale():
     t = core.TriangleData(a=a, b=b, c=c)
     t.is_right_triangle()
     assert t.is_right is True
+
+
+@pytest.mark.parametrize("scale", [1e200, 1e-200])
+def test_is_right_triangle_accepts_solved_triangle_at_extreme_magnitudes(scale):
+    # squares of these sides overflow/underflow; the check must still hold
+    t = core.TriangleData(a=3 * scale, b=4 * scale)
+    t.compute_hypotenuse()
+    t.is_right_triangle()
+    assert t.is_right is True
+
+
+def test_is_right_triangle_rejects_non_right_at_large_magnitude():
+    t = core.TriangleData(a=3e200, b=5e200, c=6e200)
+    t.is_right_triangle()
+    assert t.is_right is False
+
+
+def test_is_right_triangle_needle_triangle():
+    # computed leg is tiny compared to the other two sides
+    t = core.TriangleData(a=1.0, b=None, c=1.0 + 1e-8)
+    t.compute_leg()
+    t.normalise()
+    t.is_right_triangle()
+    assert t.is_right is True
+
+
+def test_is_right_triangle_tolerance_floor_small_scale():
+    # for tiny sides the absolute floor (1e-12) dominates the relative tolerance
+    t = core.TriangleData(a=1e-7, b=1e-7, c=1e-7)
+    t.is_right_triangle()
+    assert t.is_right is True
+
+
+@pytest.mark.parametrize("a,b,expected", [(0.0, 0.0, True), (1e-7, 0.0, True), (1.0, 0.0, False)])
+def test_is_right_triangle_zero_hypotenuse(a, b, expected):
+    t = core.TriangleData(a=a, b=b, c=0.0)
+    t.is_right_triangle()
+    assert t.is_right is expected
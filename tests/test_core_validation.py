@@ -44,6 +44,11 @@ def test_validate_value_empty_returns_none(value):
         ("3.5", 3.5),
         ("  3.5  ", 3.5),
         ("1e-3", 0.001),
+        ("1.", 1.0),
+        (".5", 0.5),
+        ("+2E2", 200.0),
+        ("1_000", 1000.0),
+        ("1_0.2_5e0_1", 102.5),
         (5, 5.0),  # TypeError не має бути, float(5) ок
     ],
 )
@@ -58,13 +63,27 @@ def test_validate_value_non_positive_raises(value):
         core.validate_value("a", value)
 
 
-@pytest.mark.parametrize("value", ["nan", "NaN", "inf", "+inf", "-inf"])
+@pytest.mark.parametrize("value", ["nan", "NaN", "inf", "+inf", "-inf", " Infinity "])
 def test_validate_value_non_finite_raises(value):
     with pytest.raises(ValueError):
         core.validate_value("a", value)
 
 
-@pytest.mark.parametrize("value", ["abc", "3,5", object()])
+@pytest.mark.parametrize("value", ["abc", "3,5", object(), "1e", "e5", ".", "--1", "1.2.3", "3 4", "1__0", "_1", "1_"])
 def test_validate_value_not_a_number_raises(value):
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="must be a number"):
         core.validate_value("a", value)
+
+
+def test_validate_value_repeated_text_uses_cache():
+    core._parse_text.cache_clear()
+    assert core.validate_value("a", "3") == 3.0
+    assert core.validate_value("a", "3") == 3.0
+    assert core._parse_text.cache_info().hits == 1
+
+
+def test_validate_value_cached_error_still_raises():
+    core._parse_text.cache_clear()
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Field b: value must be a number"):
+            core.validate_value("b", "abc")
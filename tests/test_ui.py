@@ -5,32 +5,76 @@ from pathagoras import ui_qt
 
 @pytest.fixture
 def window(qtbot):
+    # results are memoized per input; tests replace core.proceed_data
+    ui_qt._cached_proceed.cache_clear()
     w = ui_qt.MainWindow()
     qtbot.addWidget(w)
     w.show()
     return w
 
 
-def test_button_state_disabled_when_0_or_1_filled(window):
+def wait_input_applied(qtbot, window):
+    """Let the debounced input handler run."""
+    qtbot.waitUntil(lambda: not window._input_timer.isActive())
+
+
+def enter_text(qtbot, edit, text):
+    """Replace the field text the way a user would (emits textEdited)."""
+    edit.selectAll()
+    qtbot.keyClick(edit, ui_qt.Qt.Key_Backspace)
+    qtbot.keyClicks(edit, text)
+
+
+def click_action(qtbot, window):
+    """Click the action button and wait for the worker result to be shown."""
+    with qtbot.waitSignal(window.calc_done):
+        qtbot.mouseClick(window.action_button, ui_qt.Qt.LeftButton)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Leg calculated", "Leg calculated"),
+        ("One. Two! Three? Four", "One.\nTwo!\nThree?\nFour"),
+        ("c = 3.14. Done", "c = 3.14.\nDone"),   # decimal point is not a sentence end
+        ("   ", ""),
+        (None, ""),
+    ],
+)
+def test_wrap_sentences(text, expected):
+    assert ui_qt._wrap_sentences(text) == expected
+
+
+def test_wrap_sentences_is_memoized():
+    message = core.proceed_data({"a": "3", "b": "4", "c": "5"}).message
+    assert "\n" in ui_qt._wrap_sentences(message)
+    first = ui_qt._wrap_sentences(message)
+    assert ui_qt._wrap_sentences(message) is first
+
+
+def test_button_state_disabled_when_0_or_1_filled(window, qtbot):
     assert window.action_button.isEnabled() is False
     assert window.action_button.text() == "—"
 
-    window.a_edit.setText("3")
+    enter_text(qtbot, window.a_edit, "3")
+    wait_input_applied(qtbot, window)
     assert window.action_button.isEnabled() is False
     assert window.action_button.text() == "—"
 
 
-def test_button_state_calculate_when_2_filled(window):
-    window.a_edit.setText("3")
-    window.b_edit.setText("4")
+def test_button_state_calculate_when_2_filled(window, qtbot):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
     assert window.action_button.isEnabled() is True
     assert window.action_button.text() == "Calculate"
 
 
-def test_button_state_verify_when_3_filled(window):
-    window.a_edit.setText("3")
-    window.b_edit.setText("4")
-    window.c_edit.setText("5")
+def test_button_state_verify_when_3_filled(window, qtbot):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    enter_text(qtbot, window.c_edit, "5")
+    wait_input_applied(qtbot, window)
     assert window.action_button.isEnabled() is True
     assert window.action_button.text() == "Verify"
 
@@ -46,11 +90,12 @@ def test_click_calculate_normalizes_comma_and_shows_computed_output(window, qtbo
 
     monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
 
-    window.a_edit.setText("3,5")
-    window.b_edit.setText("4")
+    enter_text(qtbot, window.a_edit, "3,5")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
     assert window.action_button.text() == "Calculate"
 
-    qtbot.mouseClick(window.action_button, ui_qt.Qt.LeftButton)
+    click_action(qtbot, window)
 
     assert calls["data"]["a"] == "3.5"
     assert calls["data"]["b"] == "4"
@@ -79,12 +124,13 @@ def test_click_verify_hides_computed_output(window, qtbot, monkeypatch):
 
     monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
 
-    window.a_edit.setText("3")
-    window.b_edit.setText("4")
-    window.c_edit.setText("5")
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    enter_text(qtbot, window.c_edit, "5")
+    wait_input_applied(qtbot, window)
     assert window.action_button.text() == "Verify"
 
-    qtbot.mouseClick(window.action_button, ui_qt.Qt.LeftButton)
+    click_action(qtbot, window)
 
     assert window.output_container.isVisible() is False
     assert window.canvas.has_result is True
@@ -97,11 +143,423 @@ def test_click_error_shows_placeholder_and_hides_output(window, qtbot, monkeypat
 
     monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
 
-    window.a_edit.setText("3")
-    window.b_edit.setText("4")
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
 
-    qtbot.mouseClick(window.action_button, ui_qt.Qt.LeftButton)
+    click_action(qtbot, window)
 
     assert "boom" in window.status_label.text()
     assert window.canvas.has_result is False
     assert window.output_container.isVisible() is False
+
+
+def test_click_runs_core_off_the_ui_thread(window, qtbot, monkeypatch):
+    import threading
+
+    threads = []
+
+    def fake_proceed_data(_data):
+        threads.append(threading.current_thread())
+        return core.TriangleData(a=3.0, b=4.0, c=5.0, is_valid=True, is_right=True, message="ok")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+
+    with qtbot.waitSignal(window.calc_done):
+        qtbot.mouseClick(window.action_button, ui_qt.Qt.LeftButton)
+        # disabled until the result arrives
+        assert window.action_button.isEnabled() is False
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert window.status_label.text() == "ok"
+
+
+@pytest.mark.parametrize(
+    "txt,expected",
+    [
+        (" 3,5 ", "3.5"),
+        ("4", "4"),
+        ("1,000,5", "1.000.5"),   # every comma is replaced; core rejects it
+        ("1\u00a0000,5", "1000.5"),   # no-break space as group separator
+        ("2\u2009500", "2500"),        # thin space
+        ("12\u202f000", "12000"),      # narrow no-break space
+        ("", ""),
+    ],
+)
+def test_normalized_text(window, txt, expected):
+    assert window._normalized_text(txt) == expected
+
+
+def test_click_ignored_while_calculation_pending(window, qtbot, monkeypatch):
+    import threading
+
+    release = threading.Event()
+    calls = []
+
+    def slow_proceed_data(data):
+        calls.append(dict(data))
+        release.wait(5)
+        return core.TriangleData(a=3.0, b=4.0, c=5.0, is_valid=True, is_right=True, message="ok")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", slow_proceed_data)
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+
+    with qtbot.waitSignal(window.calc_done):
+        window.on_action_clicked()
+        window.on_action_clicked()  # second submission while the first is running
+        release.set()
+
+    assert len(calls) == 1
+    assert window._busy is False
+
+
+def test_repeated_input_reuses_core_result(window, qtbot, monkeypatch):
+    calls = []
+
+    def fake_proceed_data(data):
+        calls.append(dict(data))
+        return core.TriangleData(a=3.0, b=4.0, c=5.0, is_valid=True, is_right=True, message="ok")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
+
+    for _ in range(2):
+        enter_text(qtbot, window.a_edit, "3")
+        enter_text(qtbot, window.b_edit, "4")
+        wait_input_applied(qtbot, window)
+        click_action(qtbot, window)
+
+    assert calls == [{"a": "3", "b": "4", "c": ""}]
+    assert window.status_label.text() == "ok"
+
+
+def test_core_exception_reports_error_and_keeps_window_usable(window, qtbot, monkeypatch):
+    def failing_proceed_data(_data):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", failing_proceed_data)
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    click_action(qtbot, window)
+
+    assert window._busy is False
+    assert "boom" in window.status_label.text()
+    assert window.canvas.has_result is False
+
+    def fake_proceed_data(_data):
+        return core.TriangleData(a=3.0, b=5.0, c=5.830951895, is_valid=True, is_right=True, message="ok")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", fake_proceed_data)
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "5")
+    wait_input_applied(qtbot, window)
+    assert window.action_button.isEnabled() is True
+    click_action(qtbot, window)
+    assert window.status_label.text() == "ok"
+
+
+def test_inputs_read_only_while_calculation_pending(window, qtbot, monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    def slow_proceed_data(_data):
+        release.wait(5)
+        return core.TriangleData(a=3.0, b=4.0, c=5.0, is_valid=True, is_right=True, message="ok")
+
+    monkeypatch.setattr(ui_qt.core, "proceed_data", slow_proceed_data)
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+
+    with qtbot.waitSignal(window.calc_done):
+        window.on_action_clicked()
+        qtbot.keyClicks(window.c_edit, "5")  # typing during the calculation is ignored
+        assert window.c_edit.text() == ""
+        assert window.action_button.isEnabled() is False
+        release.set()
+
+    assert not any(e.isReadOnly() for e in (window.a_edit, window.b_edit, window.c_edit))
+
+
+def test_input_burst_is_applied_once(window, qtbot):
+    calls = []
+    window._input_timer.timeout.connect(lambda: calls.append(1))
+
+    for text in ("1", "12", "12.", "12.5"):
+        enter_text(qtbot, window.a_edit, text)
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+
+    assert len(calls) == 1
+    assert window.action_button.text() == "Calculate"
+
+
+def test_programmatic_text_changes_do_not_schedule_input_update(window):
+    window.a_edit.setText("3")
+    window.b_edit.setText("4")
+    assert window._input_timer.isActive() is False
+    assert window._filled_count() == 0
+
+
+def test_filled_count_follows_edits_and_resets_after_click(window, qtbot):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.a_edit, "35")
+    enter_text(qtbot, window.b_edit, "4")
+    assert window._filled_count() == 2
+
+    enter_text(qtbot, window.b_edit, "  ")
+    assert window._filled_count() == 1
+
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    click_action(qtbot, window)
+    assert window._filled_count() == 0
+
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    assert window.action_button.text() == "Calculate"
+
+
+def test_status_label_not_reset_with_same_text(window, qtbot, monkeypatch):
+    texts = []
+    monkeypatch.setattr(window.status_label, "setText", texts.append)
+
+    enter_text(qtbot, window.a_edit, "3")
+    wait_input_applied(qtbot, window)
+    assert texts == []  # still the initial guidance
+
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    enter_text(qtbot, window.b_edit, "45")
+    wait_input_applied(qtbot, window)
+    assert texts == [window._STATUS_2_FIELDS]
+
+
+def test_action_button_not_reset_with_same_state(window, qtbot, monkeypatch):
+    calls = []
+    monkeypatch.setattr(window.action_button, "setText", lambda text: calls.append(("text", text)))
+    monkeypatch.setattr(window.action_button, "setEnabled", lambda on: calls.append(("enabled", on)))
+
+    enter_text(qtbot, window.a_edit, "3")
+    wait_input_applied(qtbot, window)
+    assert calls == []  # still disabled, '—'
+
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    enter_text(qtbot, window.b_edit, "")
+    enter_text(qtbot, window.b_edit, "5")
+    wait_input_applied(qtbot, window)
+    assert calls == [("enabled", True), ("text", "Calculate")]
+
+
+def test_input_update_skipped_when_filled_count_unchanged(window, qtbot, monkeypatch):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+
+    calls = []
+    monkeypatch.setattr(window, "_set_status", calls.append)
+    enter_text(qtbot, window.b_edit, "")
+    enter_text(qtbot, window.b_edit, "5")
+    wait_input_applied(qtbot, window)
+
+    assert calls == []
+    assert window.action_button.text() == "Calculate"
+
+
+def test_result_message_kept_until_a_field_is_filled(window, qtbot):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    click_action(qtbot, window)
+    assert "Hypotenuse calculated" in window.status_label.text()
+
+    enter_text(qtbot, window.a_edit, "  ")
+    wait_input_applied(qtbot, window)
+    assert "Hypotenuse calculated" in window.status_label.text()
+
+    enter_text(qtbot, window.a_edit, "3")
+    wait_input_applied(qtbot, window)
+    assert window.status_label.text() == window._STATUS_EMPTY
+
+
+def test_first_edit_after_result_is_applied_immediately(window, qtbot):
+    enter_text(qtbot, window.a_edit, "3")
+    enter_text(qtbot, window.b_edit, "4")
+    wait_input_applied(qtbot, window)
+    click_action(qtbot, window)
+    assert window._showing_result is True
+
+    qtbot.keyClicks(window.a_edit, "3")
+    assert window._input_timer.isActive() is False
+    assert window._showing_result is False
+    assert window.status_label.text() == window._STATUS_EMPTY
+
+
+def test_canvas_renders_placeholder_and_result(window):
+    window.canvas.grab()
+    window.canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    window.canvas.grab()
+    window.canvas.show_result(2.0, 3.0, 4.0, is_right=False)
+    window.canvas.grab()
+
+
+def test_canvas_label_texts_follow_state(window):
+    canvas = window.canvas
+    assert (canvas._label_a, canvas._label_b, canvas._label_c) == ("a", "b", "c")
+
+    canvas.show_result(3.0, 4.5, 5.0, is_right=False)
+    assert (canvas._label_a, canvas._label_b, canvas._label_c) == ("a = 3", "b = 4.5", "c = 5")
+
+    canvas.show_placeholder()
+    assert (canvas._label_a, canvas._label_b, canvas._label_c) == ("a", "b", "c")
+
+
+def test_canvas_is_opaque_and_fills_background(window):
+    from PySide6.QtCore import Qt
+
+    canvas = window.canvas
+    assert canvas.testAttribute(Qt.WA_OpaquePaintEvent)
+    image = canvas.grab().toImage()
+    background = canvas.palette().color(canvas.backgroundRole())
+    # a pixel left of the triangle, halfway between grid lines on both axes
+    # (the grid passes through the right-angle point, its cached origin)
+    origin_x, origin_y = canvas._grid_cache_key[2]
+    step = max(8, int(canvas.grid_step_px))
+    x = origin_x % step + step // 2
+    y = origin_y % step + step // 2
+    assert x < origin_x
+    assert image.pixelColor(x, y) == background
+
+
+def test_canvas_grid_pixmap_reused_until_resize(window):
+    canvas = window.canvas
+    canvas.grab()
+    cached = canvas._grid_cache
+    assert cached is not None
+
+    canvas.grab()
+    assert canvas._grid_cache is cached
+
+    canvas.resize(canvas.width() + 40, canvas.height())
+    canvas.grab()
+    assert canvas._grid_cache is not cached
+
+
+def test_canvas_pens_follow_palette_change(window):
+    from PySide6.QtGui import QColor
+
+    canvas = window.canvas
+    canvas.grab()
+    assert canvas._frame_cache is not None
+
+    palette = canvas.palette()
+    palette.setColor(canvas.foregroundRole(), QColor("red"))
+    palette.setColor(canvas.backgroundRole(), QColor("white"))
+    canvas.setPalette(palette)
+
+    assert canvas._frame_cache is None
+    assert canvas._grid_cache is None
+    assert canvas._pen_tri.color() == QColor("red")
+    assert canvas._pen_ra.color() == QColor("red")
+    assert canvas._pen_text.color() == QColor("red")
+    assert canvas._bg == QColor("white")
+    assert canvas._pen_minor.color().red() == 255
+    assert canvas._pen_minor.color().alpha() == 35
+    assert canvas._pen_major.color().alpha() == 70
+
+
+def test_canvas_geometry_reused_until_size_or_legs_change(window):
+    from PySide6.QtGui import QColor
+
+    canvas = window.canvas
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    canvas.grab()
+    cached = canvas._geom_cache
+    assert cached is not None
+
+    # colors only: frame is re-rendered, geometry is reused
+    palette = canvas.palette()
+    palette.setColor(canvas.foregroundRole(), QColor("blue"))
+    canvas.setPalette(palette)
+    canvas.grab()
+    assert canvas._geom_cache is cached
+
+    canvas.show_result(5.0, 12.0, 13.0, is_right=True)
+    canvas.grab()
+    assert canvas._geom_cache is not cached
+
+    cached = canvas._geom_cache
+    canvas.resize(canvas.width() + 40, canvas.height())
+    canvas.grab()
+    assert canvas._geom_cache is not cached
+
+
+def test_canvas_frame_pixmap_rebuilt_only_on_state_change(window):
+    canvas = window.canvas
+    canvas.grab()
+    cached = canvas._frame_cache
+    canvas.grab()
+    assert canvas._frame_cache is cached
+
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    canvas.grab()
+    assert canvas._frame_cache is not cached
+
+
+def test_canvas_state_change_paints_once(window, qtbot):
+    from PySide6.QtCore import QEvent, QObject
+
+    class PaintCounter(QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                self.count += 1
+            return False
+
+    canvas = window.canvas
+    qtbot.waitExposed(canvas)
+    counter = PaintCounter()
+    canvas.installEventFilter(counter)
+
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    canvas.show_placeholder()
+    canvas.show_result(5.0, 12.0, 13.0, is_right=True)
+    qtbot.waitUntil(lambda: counter.count > 0)
+    qtbot.wait(20)
+
+    assert counter.count == 1
+    canvas.removeEventFilter(counter)
+
+
+def test_canvas_skips_update_when_state_unchanged(window, monkeypatch):
+    canvas = window.canvas
+    updates = []
+    monkeypatch.setattr(canvas, "update", lambda: updates.append(1))
+
+    canvas.show_placeholder()
+    assert updates == []
+
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    assert len(updates) == 1
+
+    canvas.show_placeholder()
+    canvas.show_placeholder()
+    assert len(updates) == 2
+
+    canvas.show_result(3.0, 4.0, 5.0, is_right=True)
+    assert len(updates) == 3